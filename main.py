@@ -8,7 +8,7 @@ Forward links included:
 - (Optional) child_page blocks (sub-pages in the tree) are naturally traversed because they appear as blocks too.
 
 Requires:
-  pip install notion-client python-slugify requests
+  pip install notion-client python-slugify httpx
 
 Auth:
   export NOTION_TOKEN="secret_..."
@@ -26,17 +26,33 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import io
+import json
+import multiprocessing
 import os
+import random
 import re
+import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set, Tuple
 
-import requests
+import httpx
 from notion_client import Client
 from notion_client.errors import APIResponseError
 from slugify import slugify
 
+try:
+    import orjson  # optional: 2-10x faster JSON for API responses and the cache
+except ImportError:
+    orjson = None
+
 NOTION_VERSION_DEFAULT = "2022-06-28"
 
 
@@ -48,6 +64,7 @@ UUID32_RE = re.compile(r"([0-9a-fA-F]{32})")
 UUID36_RE = re.compile(r"([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})")
 
 
+@functools.lru_cache(maxsize=8192)
 def normalize_page_id(value: str) -> str:
     """
     Accepts:
@@ -55,6 +72,8 @@ def normalize_page_id(value: str) -> str:
       - 32-hex id
       - canonical UUID with hyphens (36 chars)
     Returns canonical UUID with hyphens (lowercase).
+    Cached: the same hrefs repeat constantly across a workspace
+    (nav links, backlinks), and each miss costs two regex searches.
     """
     value = value.strip()
 
@@ -71,23 +90,89 @@ def normalize_page_id(value: str) -> str:
     return f"{raw[0:8]}-{raw[8:12]}-{raw[12:16]}-{raw[16:20]}-{raw[20:32]}"
 
 
+@functools.lru_cache(maxsize=8192)
 def safe_filename(title: str, page_id: str) -> str:
     """
     Create a stable, collision-resistant filename.
+    Cached so repeated slugification of the same title is free.
     """
     base = slugify(title) or "untitled"
     short = page_id.replace("-", "")[:10]
     return f"{base}--{short}.md"
 
 
-def with_retry(fn, *, max_tries: int = 6, base_sleep: float = 0.6):
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces Notion API calls so concurrent
+    workers stay under the per-integration rate limit (~3 req/sec) instead
+    of bursting into 429s and burning retries.
+    """
+
+    def __init__(self, rate: float = 3.0, capacity: float = 3.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Block until a token is available, then consume it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared limiter for every Notion call; rate is tunable via --rps.
+RATE_LIMITER = TokenBucket()
+
+# Tunable via --max-tries / --base-sleep; long exports near the rate
+# ceiling may want more tries or a gentler ramp.
+RETRY_MAX_TRIES = 6
+RETRY_BASE_SLEEP = 0.6
+
+
+def _retry_after_seconds(e: APIResponseError) -> Optional[float]:
+    """
+    Extract the Retry-After header (seconds) from a Notion error, if present.
+    """
+    headers = getattr(e, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def with_retry(fn, *, max_tries: Optional[int] = None, base_sleep: Optional[float] = None):
     """
-    Basic exponential backoff for Notion API rate limits/transient errors.
+    Backoff for Notion API rate limits/transient errors. Honors the server's
+    Retry-After header on 429s; otherwise falls back to exponential backoff
+    with jitter (so concurrent workers don't retry in lockstep).
+    Every attempt first takes a token from the shared rate limiter.
     Does NOT retry on 400/404 errors (permanent failures).
     """
+    if max_tries is None:
+        max_tries = RETRY_MAX_TRIES
+    if base_sleep is None:
+        base_sleep = RETRY_BASE_SLEEP
+
     last_err = None
     for i in range(max_tries):
         try:
+            RATE_LIMITER.acquire()
             return fn()
         except APIResponseError as e:
             last_err = e
@@ -97,7 +182,10 @@ def with_retry(fn, *, max_tries: int = 6, base_sleep: float = 0.6):
                 raise
             # Retry on rate limits and server errors
             if status in (429, 500, 502, 503, 504) or status is None:
-                sleep_s = base_sleep * (2**i)
+                sleep_s = _retry_after_seconds(e)
+                if sleep_s is None:
+                    sleep_s = base_sleep * (2**i)
+                    sleep_s += random.uniform(0, 0.3 * sleep_s)
                 time.sleep(sleep_s)
                 continue
             raise
@@ -109,6 +197,34 @@ def with_retry(fn, *, max_tries: int = 6, base_sleep: float = 0.6):
 # ----------------------------
 
 
+# Style wrappers applied innermost-first; underline uses HTML because
+# Markdown has no standard underline.
+_ANNOTATION_WRAPPERS = (
+    ("code", "`", "`"),
+    ("bold", "**", "**"),
+    ("italic", "*", "*"),
+    ("strikethrough", "~~", "~~"),
+    ("underline", "<u>", "</u>"),
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _href_page_id(href: str) -> Optional[str]:
+    """
+    Return the normalized page id embedded in an href, or None for
+    non-Notion links. Cheap length gate first: a page href always carries a
+    32-hex id, so short external URLs skip the regex work entirely.
+    Caching the None results means a repeated external URL pays the
+    failed-parse cost (regexes plus a raised ValueError) only once.
+    """
+    if len(href) < 32:
+        return None
+    try:
+        return normalize_page_id(href)
+    except ValueError:
+        return None
+
+
 def rich_text_to_md(rich: List[Dict[str, Any]], link_map: Dict[str, str]) -> Tuple[str, Set[str]]:
     """
     Convert Notion rich_text array to Markdown.
@@ -131,55 +247,91 @@ def rich_text_to_md(rich: List[Dict[str, Any]], link_map: Dict[str, str]) -> Tup
         href = rt.get("href")
         if href:
             # If href contains a Notion page id, rewrite to local file if known later
-            try:
-                pid = normalize_page_id(href)
+            pid = _href_page_id(href)
+            if pid:
                 found_links.add(pid)
                 # Use plain as label; target resolved later when link_map filled
                 out.append(f"[{plain}]({{PAGE:{pid}}})")
-                continue
-            except Exception:
+            else:
                 # not a notion page link; keep as-is
                 out.append(f"[{plain}]({href})")
-                continue
+            continue
 
         annotations = rt.get("annotations", {}) or {}
         text = plain
 
-        # Apply styles (minimal but decent)
-        if annotations.get("code"):
-            text = f"`{text}`"
-        if annotations.get("bold"):
-            text = f"**{text}**"
-        if annotations.get("italic"):
-            text = f"*{text}*"
-        if annotations.get("strikethrough"):
-            text = f"~~{text}~~"
-        if annotations.get("underline"):
-            # Markdown underline isn't standard; use HTML
-            text = f"<u>{text}</u>"
+        # Apply styles (minimal but decent): collect active wrappers once,
+        # then build the run with a single concatenation.
+        opens: List[str] = []
+        closes: List[str] = []
+        for key, open_mark, close_mark in _ANNOTATION_WRAPPERS:
+            if annotations.get(key):
+                opens.append(open_mark)
+                closes.append(close_mark)
+        if opens:
+            text = "".join(reversed(opens)) + text + "".join(closes)
 
         out.append(text)
 
     return "".join(out), found_links
 
 
-def replace_page_placeholders(md: str, link_map: Dict[str, str]) -> str:
+_PLACEHOLDER_PREFIX = "{PAGE:"
+_PLACEHOLDER_LEN = len(_PLACEHOLDER_PREFIX) + 36 + 1  # "{PAGE:" + uuid + "}"
+_PLACEHOLDER_CHARS = frozenset("0123456789abcdef-")
+
+
+def make_placeholder_rewriter(link_map: Dict[str, str]):
     """
-    Replace placeholders like {PAGE:<uuid>} with relative links based on link_map.
+    Build a reusable text -> text translator that replaces {PAGE:<uuid>}
+    placeholders with relative links based on link_map. Placeholders have a
+    fixed shape, so the translator scans with str.find on the literal
+    "{PAGE:" prefix — no regex engine, no backtracking — and text without
+    placeholders (the overwhelmingly common case) is returned untouched
+    after a single find.
     """
+    get = link_map.get
+    prefix_len = len(_PLACEHOLDER_PREFIX)
+
+    def rewrite(md: str) -> str:
+        pos = md.find(_PLACEHOLDER_PREFIX)
+        if pos == -1:
+            return md
+        out: List[str] = []
+        last = 0
+        while pos != -1:
+            end = pos + _PLACEHOLDER_LEN
+            pid = md[pos + prefix_len : end - 1]
+            if end <= len(md) and md[end - 1] == "}" and _PLACEHOLDER_CHARS.issuperset(pid):
+                target = get(pid)
+                out.append(md[last:pos])
+                if target:
+                    out.append(f"./{target}")
+                else:
+                    # fallback to notion URL
+                    out.append(f"https://www.notion.so/{pid.replace('-', '')}")
+                last = end
+                pos = md.find(_PLACEHOLDER_PREFIX, end)
+            else:
+                # Literal "{PAGE:" that isn't a real placeholder; keep scanning.
+                pos = md.find(_PLACEHOLDER_PREFIX, pos + 1)
+        out.append(md[last:])
+        return "".join(out)
 
-    def repl(m):
-        pid = m.group(1).lower()
-        target = link_map.get(pid)
-        if not target:
-            # fallback to notion URL
-            return f"https://www.notion.so/{pid.replace('-', '')}"
-        return f"./{target}"
+    return rewrite
 
-    return re.sub(r"\{PAGE:([0-9a-f\-]{36})\}", repl, md)
+
+def replace_page_placeholders(md: str, link_map: Dict[str, str]) -> str:
+    """
+    Replace placeholders like {PAGE:<uuid>} with relative links based on link_map.
+    One-shot convenience wrapper around make_placeholder_rewriter.
+    """
+    return make_placeholder_rewriter(link_map)(md)
 
 
 def indent_lines(text: str, n: int) -> str:
+    # Legacy fallback for indenting an already-rendered chunk; the streaming
+    # renderer emits lines pre-padded instead (see _LineStream.line).
     pad = " " * n
     return "\n".join(pad + line if line.strip() else line for line in text.splitlines())
 
@@ -190,188 +342,300 @@ class RenderResult:
     linked_pages: Set[str]
 
 
-def blocks_to_md(blocks: List[Dict[str, Any]], link_map: Dict[str, str], depth: int = 0) -> RenderResult:
+class _LineStream:
+    """
+    Line-oriented writer over a write callback. Blank lines are deferred and
+    dropped at end-of-stream, mirroring the old join().rstrip() behavior
+    without ever holding the full document in memory.
+
+    Indentation is applied here, once, as each line is emitted — nested
+    output is never re-padded by ancestor levels, so depth-N lists cost
+    O(total length) instead of O(N * total length).
+    """
+
+    __slots__ = ("_write", "_pending_blanks", "content_lines")
+
+    def __init__(self, write):
+        self._write = write
+        self._pending_blanks = 0
+        self.content_lines = 0
+
+    def line(self, text: str, indent: int = 0) -> None:
+        if not text.strip():
+            self._pending_blanks += 1
+            return
+        if self._pending_blanks:
+            self._write("\n" * self._pending_blanks)
+            self._pending_blanks = 0
+        if indent:
+            pad = " " * indent
+            if "\n" in text:
+                text = "\n".join(pad + line if line.strip() else line for line in text.splitlines())
+            else:
+                text = pad + text
+        self._write(text + "\n")
+        self.content_lines += 1
+
+    def pending_mark(self) -> Tuple[int, int]:
+        """Snapshot (content lines, queued blanks) for rollback_blanks."""
+        return self.content_lines, self._pending_blanks
+
+    def rollback_blanks(self, mark: Tuple[int, int]) -> None:
+        """
+        Drop blank lines queued since `mark`. Only valid while no content
+        line has been written since the mark was taken.
+        """
+        self._pending_blanks = mark[1]
+
+
+def blocks_to_md(
+    blocks: List[Dict[str, Any]],
+    link_map: Dict[str, str],
+    depth: int = 0,
+    write=None,
+) -> RenderResult:
     """
     Render a list of Notion blocks into Markdown.
     Collects forward page links found in rich text and link_to_page blocks.
-    """
-    lines: List[str] = []
-    linked: Set[str] = set()
 
+    When `write` is given, lines are streamed to it (the page is never held
+    in memory as one string) and the returned md is empty. Without it, the
+    full Markdown string is buffered and returned, as before.
+    """
+    if write is not None:
+        linked = _render_blocks(blocks, link_map, _LineStream(write), depth)
+        return RenderResult(md="", linked_pages=linked)
+
+    buf = io.StringIO()
+    linked = _render_blocks(blocks, link_map, _LineStream(buf.write), depth)
+    return RenderResult(md=buf.getvalue() or "\n", linked_pages=linked)
+
+
+def _render_blocks(
+    blocks: List[Dict[str, Any]],
+    link_map: Dict[str, str],
+    stream: _LineStream,
+    depth: int,
+    indent: int = 0,
+) -> Set[str]:
     # List handling: Notion returns list items as consecutive blocks.
     # We'll render them with simple prefixes; nested list levels are represented via children.
+    linked: Set[str] = set()
+    get_handler = _HANDLERS.get
     for b in blocks:
-        btype = b.get("type")
-        bid = b.get("id")
-        has_children = b.get("has_children", False)
-
-        def render_children() -> RenderResult:
-            if not has_children:
-                return RenderResult(md="", linked_pages=set())
-            # Children are rendered by the caller (we fetch externally) — here we assume children already in b["_children"].
-            children = b.get("_children", []) or []
-            return blocks_to_md(children, link_map, depth=depth + 1)
-
-        if btype in ("paragraph", "heading_1", "heading_2", "heading_3", "quote", "callout"):
-            payload = b.get(btype, {})
-            text, found = rich_text_to_md(payload.get("rich_text", []), link_map)
-            linked |= found
-
-            if btype == "paragraph":
-                if text.strip():
-                    lines.append(text)
-                else:
-                    lines.append("")  # preserve blank lines
-            elif btype.startswith("heading_"):
-                level = {"heading_1": "#", "heading_2": "##", "heading_3": "###"}[btype]
-                lines.append(f"{level} {text}".rstrip())
-            elif btype == "quote":
-                lines.append(f"> {text}".rstrip())
-            elif btype == "callout":
-                icon = payload.get("icon")
-                icon_txt = ""
-                if isinstance(icon, dict):
-                    if icon.get("type") == "emoji":
-                        icon_txt = icon.get("emoji", "") + " "
-                # A simple callout style
-                lines.append(f"> {icon_txt}{text}".rstrip())
-
-            child_res = render_children()
-            if child_res.md.strip():
-                lines.append(child_res.md)
-            linked |= child_res.linked_pages
-
-        elif btype in ("bulleted_list_item", "numbered_list_item", "to_do", "toggle"):
-            payload = b.get(btype, {})
-            text, found = rich_text_to_md(payload.get("rich_text", []), link_map)
-            linked |= found
-
-            prefix = "-"
-            if btype == "numbered_list_item":
-                prefix = "1."
-            elif btype == "to_do":
-                checked = payload.get("checked", False)
-                prefix = "- [x]" if checked else "- [ ]"
-            elif btype == "toggle":
-                prefix = "-"
-
-            if btype == "toggle":
-                # Use HTML details/summary for a good Markdown experience
-                lines.append(f"<details>")
-                lines.append(f"<summary>{text}</summary>")
-                child_res = render_children()
-                if child_res.md.strip():
-                    lines.append("")
-                    lines.append(child_res.md)
-                    lines.append("")
-                lines.append(f"</details>")
-                linked |= child_res.linked_pages
-            else:
-                lines.append(f"{prefix} {text}".rstrip())
-                child_res = render_children()
-                if child_res.md.strip():
-                    lines.append(indent_lines(child_res.md, 2))
-                linked |= child_res.linked_pages
-
-        elif btype == "code":
-            payload = b.get("code", {})
-            code_text, found = rich_text_to_md(payload.get("rich_text", []), link_map)
-            linked |= found
-            lang = payload.get("language", "") or ""
-            lines.append(f"```{lang}".rstrip())
-            lines.append(code_text)
-            lines.append("```")
-            child_res = render_children()
-            linked |= child_res.linked_pages
-            if child_res.md.strip():
-                lines.append(child_res.md)
-
-        elif btype == "divider":
-            lines.append("---")
-
-        elif btype == "link_to_page":
-            lp = b.get("link_to_page", {})
-            lpt = lp.get("type")
-            if lpt == "page_id":
-                pid = lp.get("page_id")
-                if pid:
-                    linked.add(pid)
-                    # Placeholder link; resolved later
-                    lines.append(f"- [Linked page]({{PAGE:{pid}}})")
-            else:
-                # database_id etc.
-                lines.append(f"- Linked: {lpt}")
-
-        elif btype == "child_page":
-            # This is a sub-page block; treat as a forward link too
-            title = b.get("child_page", {}).get("title", "Subpage")
-            # child_page has id = page id
-            if bid:
-                linked.add(bid)
-                lines.append(f"- [{title}]({{PAGE:{bid}}})")
-
-        elif btype in ("image", "file", "pdf", "video", "audio"):
-            payload = b.get(btype, {})
-            caption, found = rich_text_to_md(payload.get("caption", []), link_map)
-            linked |= found
-
-            # Files can be "external" or "file"
-            url = None
-            if payload.get("type") == "external":
-                url = payload["external"].get("url")
-            elif payload.get("type") == "file":
-                url = payload["file"].get("url")
-
-            if btype == "image" and url:
-                alt = caption if caption.strip() else "image"
-                lines.append(f"![{alt}]({url})")
-            elif url:
-                label = caption.strip() or btype
-                lines.append(f"[{label}]({url})")
-
-        elif btype == "bookmark":
-            payload = b.get("bookmark", {})
-            url = payload.get("url")
-            caption, found = rich_text_to_md(payload.get("caption", []), link_map)
-            linked |= found
-            label = caption.strip() or url or "bookmark"
-            if url:
-                lines.append(f"[{label}]({url})")
-
-        elif btype == "table":
-            # Notion tables are blocks with child rows.
-            # We'll do a basic HTML table fallback (widely compatible in Markdown renderers).
-            rows = b.get("_children", []) or []
-            html_lines = ["<table>"]
-            for row in rows:
-                if row.get("type") != "table_row":
-                    continue
-                cells = row.get("table_row", {}).get("cells", [])
-                html_lines.append("<tr>")
-                for cell in cells:
-                    cell_md, found = rich_text_to_md(cell, link_map)
-                    linked |= found
-                    html_lines.append(f"<td>{cell_md}</td>")
-                html_lines.append("</tr>")
-            html_lines.append("</table>")
-            lines.extend(html_lines)
-
+        get_handler(b.get("type"), _render_fallback)(b, link_map, stream, linked, depth, indent)
+    return linked
+
+
+def _render_children_into(
+    b: Dict[str, Any],
+    link_map: Dict[str, str],
+    stream: _LineStream,
+    linked: Set[str],
+    depth: int,
+    indent: int,
+) -> bool:
+    """
+    Render a block's fetched children ("_children") straight into the shared
+    stream at the given absolute indent. Returns True if the children
+    produced any content line.
+    """
+    if not b.get("has_children"):
+        return False
+    children = b.get("_children", []) or []
+    before = stream.content_lines
+    linked |= _render_blocks(children, link_map, stream, depth + 1, indent)
+    return stream.content_lines > before
+
+
+def _render_text_block(b, link_map, stream, linked, depth, indent) -> None:
+    btype = b["type"]
+    payload = b.get(btype, {})
+    text, found = rich_text_to_md(payload.get("rich_text", []), link_map)
+    linked |= found
+
+    if btype == "paragraph":
+        if text.strip():
+            stream.line(text, indent)
         else:
-            # Fallback: try to render any rich_text we can find
-            payload = b.get(btype, {}) if btype else {}
-            rt = payload.get("rich_text", []) if isinstance(payload, dict) else []
-            text, found = rich_text_to_md(rt, link_map)
+            stream.line("")  # preserve blank lines
+    elif btype.startswith("heading_"):
+        level = {"heading_1": "#", "heading_2": "##", "heading_3": "###"}[btype]
+        stream.line(f"{level} {text}".rstrip(), indent)
+    elif btype == "quote":
+        stream.line(f"> {text}".rstrip(), indent)
+    elif btype == "callout":
+        icon = payload.get("icon")
+        icon_txt = ""
+        if isinstance(icon, dict):
+            if icon.get("type") == "emoji":
+                icon_txt = icon.get("emoji", "") + " "
+        # A simple callout style
+        stream.line(f"> {icon_txt}{text}".rstrip(), indent)
+
+    if _render_children_into(b, link_map, stream, linked, depth, indent):
+        stream.line("")  # keep children separated from what follows
+
+
+def _render_list_item(b, link_map, stream, linked, depth, indent) -> None:
+    btype = b["type"]
+    payload = b.get(btype, {})
+    text, found = rich_text_to_md(payload.get("rich_text", []), link_map)
+    linked |= found
+
+    if btype == "toggle":
+        # Use HTML details/summary for a good Markdown experience
+        stream.line("<details>", indent)
+        stream.line(f"<summary>{text}</summary>", indent)
+        mark = stream.pending_mark()
+        stream.line("")  # blank before children, dropped if they're empty
+        if _render_children_into(b, link_map, stream, linked, depth, indent):
+            stream.line("")
+        else:
+            stream.rollback_blanks(mark)
+        stream.line("</details>", indent)
+        return
+
+    prefix = "-"
+    if btype == "numbered_list_item":
+        prefix = "1."
+    elif btype == "to_do":
+        checked = payload.get("checked", False)
+        prefix = "- [x]" if checked else "- [ ]"
+
+    stream.line(f"{prefix} {text}".rstrip(), indent)
+    # Nested content sits two spaces deeper; lines come out pre-padded.
+    _render_children_into(b, link_map, stream, linked, depth, indent + 2)
+
+
+def _render_code(b, link_map, stream, linked, depth, indent) -> None:
+    payload = b.get("code", {})
+    code_text, found = rich_text_to_md(payload.get("rich_text", []), link_map)
+    linked |= found
+    lang = payload.get("language", "") or ""
+    stream.line(f"```{lang}".rstrip(), indent)
+    stream.line(code_text, indent)
+    stream.line("```", indent)
+    if _render_children_into(b, link_map, stream, linked, depth, indent):
+        stream.line("")
+
+
+def _render_divider(b, link_map, stream, linked, depth, indent) -> None:
+    stream.line("---", indent)
+
+
+def _render_link_to_page(b, link_map, stream, linked, depth, indent) -> None:
+    lp = b.get("link_to_page", {})
+    lpt = lp.get("type")
+    if lpt == "page_id":
+        pid = lp.get("page_id")
+        if pid:
+            linked.add(pid)
+            # Placeholder link; resolved later
+            stream.line(f"- [Linked page]({{PAGE:{pid}}})", indent)
+    else:
+        # database_id etc.
+        stream.line(f"- Linked: {lpt}", indent)
+
+
+def _render_child_page(b, link_map, stream, linked, depth, indent) -> None:
+    # This is a sub-page block; treat as a forward link too
+    title = b.get("child_page", {}).get("title", "Subpage")
+    # child_page has id = page id
+    bid = b.get("id")
+    if bid:
+        linked.add(bid)
+        stream.line(f"- [{title}]({{PAGE:{bid}}})", indent)
+
+
+def _render_media(b, link_map, stream, linked, depth, indent) -> None:
+    btype = b["type"]
+    payload = b.get(btype, {})
+    caption, found = rich_text_to_md(payload.get("caption", []), link_map)
+    linked |= found
+
+    # Files can be "external" or "file"
+    url = None
+    if payload.get("type") == "external":
+        url = payload["external"].get("url")
+    elif payload.get("type") == "file":
+        url = payload["file"].get("url")
+
+    if btype == "image" and url:
+        alt = caption if caption.strip() else "image"
+        stream.line(f"![{alt}]({url})", indent)
+    elif url:
+        label = caption.strip() or btype
+        stream.line(f"[{label}]({url})", indent)
+
+
+def _render_bookmark(b, link_map, stream, linked, depth, indent) -> None:
+    payload = b.get("bookmark", {})
+    url = payload.get("url")
+    caption, found = rich_text_to_md(payload.get("caption", []), link_map)
+    linked |= found
+    label = caption.strip() or url or "bookmark"
+    if url:
+        stream.line(f"[{label}]({url})", indent)
+
+
+def _render_table(b, link_map, stream, linked, depth, indent) -> None:
+    # Notion tables are blocks with child rows.
+    # We'll do a basic HTML table fallback (widely compatible in Markdown renderers).
+    rows = b.get("_children", []) or []
+    stream.line("<table>", indent)
+    for row in rows:
+        if row.get("type") != "table_row":
+            continue
+        cells = row.get("table_row", {}).get("cells", [])
+        stream.line("<tr>", indent)
+        for cell in cells:
+            cell_md, found = rich_text_to_md(cell, link_map)
             linked |= found
-            if text.strip():
-                lines.append(text)
-
-            child_res = render_children()
-            linked |= child_res.linked_pages
-            if child_res.md.strip():
-                lines.append(child_res.md)
-
-    md = "\n".join(lines).rstrip() + "\n"
-    return RenderResult(md=md, linked_pages=linked)
+            stream.line(f"<td>{cell_md}</td>", indent)
+        stream.line("</tr>", indent)
+    stream.line("</table>", indent)
+
+
+def _render_fallback(b, link_map, stream, linked, depth, indent) -> None:
+    # Fallback: try to render any rich_text we can find
+    btype = b.get("type")
+    payload = b.get(btype, {}) if btype else {}
+    rt = payload.get("rich_text", []) if isinstance(payload, dict) else []
+    text, found = rich_text_to_md(rt, link_map)
+    linked |= found
+    if text.strip():
+        stream.line(text, indent)
+
+    if _render_children_into(b, link_map, stream, linked, depth, indent):
+        stream.line("")
+
+
+# One handler per block type, dispatched by _render_blocks; unknown types
+# fall through to _render_fallback.
+_HANDLERS: Dict[str, Any] = {
+    "paragraph": _render_text_block,
+    "heading_1": _render_text_block,
+    "heading_2": _render_text_block,
+    "heading_3": _render_text_block,
+    "quote": _render_text_block,
+    "callout": _render_text_block,
+    "bulleted_list_item": _render_list_item,
+    "numbered_list_item": _render_list_item,
+    "to_do": _render_list_item,
+    "toggle": _render_list_item,
+    "code": _render_code,
+    "divider": _render_divider,
+    "link_to_page": _render_link_to_page,
+    "child_page": _render_child_page,
+    "image": _render_media,
+    "file": _render_media,
+    "pdf": _render_media,
+    "video": _render_media,
+    "audio": _render_media,
+    "bookmark": _render_bookmark,
+    "table": _render_table,
+}
 
 
 # ----------------------------
@@ -401,19 +665,41 @@ def fetch_all_block_children(notion: Client, block_id: str) -> List[Dict[str, An
     return results
 
 
-def hydrate_children(notion: Client, blocks: List[Dict[str, Any]]) -> None:
+def hydrate_children(
+    notion: Client,
+    blocks: List[Dict[str, Any]],
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> None:
     """
-    Recursively fetch children for blocks that have_children.
+    Fetch children for blocks that have_children.
     Store children in block["_children"] to avoid changing rendering signatures.
+
+    The walk is iterative (explicit stack / in-flight future map), so deeply
+    nested toggles and lists can't hit Python's recursion limit. With an
+    executor, a fetch is submitted the moment a block with children is seen,
+    and resolved children immediately feed new fetches — no per-level barrier.
     """
-    for b in blocks:
-        if b.get("has_children"):
-            bid = b.get("id")
-            if not bid:
-                continue
-            kids = fetch_all_block_children(notion, bid)
+    pending = [b for b in blocks if b.get("has_children") and b.get("id")]
+
+    if executor is None:
+        stack = pending
+        while stack:
+            b = stack.pop()
+            kids = fetch_all_block_children(notion, b["id"])
             b["_children"] = kids
-            hydrate_children(notion, kids)
+            stack.extend(k for k in kids if k.get("has_children") and k.get("id"))
+        return
+
+    in_flight = {executor.submit(fetch_all_block_children, notion, b["id"]): b for b in pending}
+    while in_flight:
+        done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+        for fut in done:
+            b = in_flight.pop(fut)
+            kids = fut.result()
+            b["_children"] = kids
+            for k in kids:
+                if k.get("has_children") and k.get("id"):
+                    in_flight[executor.submit(fetch_all_block_children, notion, k["id"])] = k
 
 
 def detect_id_type(notion: Client, id_str: str) -> str:
@@ -444,11 +730,25 @@ def detect_id_type(notion: Client, id_str: str) -> str:
     raise ValueError(f"Could not identify {id_str} as a page or database. Make sure it's shared with your integration.")
 
 
-def get_database_pages(notion: Client, database_id: str) -> List[str]:
+def _title_from_properties(props: Optional[Dict[str, Any]]) -> Optional[str]:
     """
-    Query a database and return all page IDs within it.
+    Extract the title property (type == "title") from a page's properties.
     """
-    results: List[str] = []
+    for prop in (props or {}).values():
+        if isinstance(prop, dict) and prop.get("type") == "title":
+            title_arr = prop.get("title", [])
+            title = "".join(t.get("plain_text", "") for t in title_arr)
+            return title.strip() or "Untitled"
+    return None
+
+
+def get_database_pages(notion: Client, database_id: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Query a database and return (page_id, title) for all pages within it.
+    Titles come straight from the query response properties, saving a
+    pages.retrieve round trip per page.
+    """
+    results: List[Tuple[str, Optional[str]]] = []
     cursor = None
 
     while True:
@@ -462,7 +762,7 @@ def get_database_pages(notion: Client, database_id: str) -> List[str]:
         resp = with_retry(call)
         for item in resp.get("results", []):
             if item.get("object") == "page":
-                results.append(item["id"])
+                results.append((item["id"], _title_from_properties(item.get("properties"))))
 
         if resp.get("has_more"):
             cursor = resp.get("next_cursor")
@@ -472,9 +772,9 @@ def get_database_pages(notion: Client, database_id: str) -> List[str]:
     return results
 
 
-def get_page_title(notion: Client, page_id: str) -> Optional[str]:
+def get_page(notion: Client, page_id: str) -> Optional[Dict[str, Any]]:
     """
-    Retrieve a page and extract its title property.
+    Retrieve a page object.
     Returns None if the page is inaccessible (404/403).
     """
 
@@ -482,7 +782,7 @@ def get_page_title(notion: Client, page_id: str) -> Optional[str]:
         return notion.pages.retrieve(page_id=page_id)
 
     try:
-        page = with_retry(call)
+        return with_retry(call)
     except APIResponseError as e:
         status = getattr(e, "status", None)
         if status in (403, 404):
@@ -490,16 +790,74 @@ def get_page_title(notion: Client, page_id: str) -> Optional[str]:
             return None
         raise
 
-    props = page.get("properties", {}) or {}
 
-    # Find the title property (type == "title")
-    for _, prop in props.items():
-        if isinstance(prop, dict) and prop.get("type") == "title":
-            title_arr = prop.get("title", [])
-            title = "".join([t.get("plain_text", "") for t in title_arr])
-            return title.strip() or "Untitled"
+def get_page_title(notion: Client, page_id: str) -> Optional[str]:
+    """
+    Retrieve a page and extract its title property.
+    Returns None if the page is inaccessible (404/403).
+    """
+    page = get_page(notion, page_id)
+    if page is None:
+        return None
+    return _title_from_properties(page.get("properties", {})) or "Untitled"
+
 
-    return "Untitled"
+def _load_cached_blocks(cache_path: str, last_edited_time: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Return the hydrated block tree cached for a page, or None when there is
+    no cache entry or the page has been edited since it was written.
+    """
+    if not last_edited_time:
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+        entry = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return None
+    if entry.get("last_edited_time") != last_edited_time:
+        return None
+    return entry.get("blocks")
+
+
+def _store_cached_blocks(
+    cache_path: str, last_edited_time: Optional[str], blocks: List[Dict[str, Any]]
+) -> None:
+    """
+    Write a page's hydrated block tree to the cache. Writes go through a
+    temp file + atomic rename so concurrent workers or a crash never leave
+    a torn entry behind.
+    """
+    if not last_edited_time:
+        return
+    entry = {"last_edited_time": last_edited_time, "blocks": blocks}
+    payload = orjson.dumps(entry) if orjson is not None else json.dumps(entry).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort; a failed write just means a refetch later.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _collect_child_page_titles(blocks: List[Dict[str, Any]], titles: Dict[str, str]) -> None:
+    """
+    Harvest child_page titles from a hydrated block tree. The crawler uses
+    them so discovered subpages can skip their own pages.retrieve call.
+    """
+    stack = list(blocks)
+    while stack:
+        b = stack.pop()
+        if b.get("type") == "child_page" and b.get("id"):
+            title = b.get("child_page", {}).get("title")
+            if title:
+                titles[b["id"].lower()] = title
+        stack.extend(b.get("_children", []) or [])
 
 
 # ----------------------------
@@ -512,24 +870,126 @@ class PageExport:
     page_id: str
     title: str
     filename: str
-    md_raw: str
+    raw_path: str  # temp file holding the rendered markdown, pre link-rewrite
     forward_links: Set[str]
 
 
+def _fetch_page(
+    notion: Client,
+    pid: str,
+    block_pool: ThreadPoolExecutor,
+    titles: Dict[str, str],
+    cache_dir: Optional[str] = None,
+) -> Optional[Tuple[str, List[Dict[str, Any]], Dict[str, str]]]:
+    """
+    Fetch and hydrate a single page. Returns (title, hydrated blocks,
+    child-page titles discovered in those blocks), or None if the page is
+    inaccessible (caller records it as skipped). Pure I/O — rendering
+    happens separately so it can run in a worker process.
+
+    Titles already known — from a child_page block, or a database query —
+    skip the pages.retrieve round trip, roughly halving API calls for pages
+    discovered through the page tree.
+
+    With cache_dir set, each page costs one pages.retrieve for change
+    detection; if its last_edited_time matches the cached entry, the whole
+    block fetch is skipped and the cached hydrated tree is rendered instead.
+    """
+    title = titles.get(pid)
+    blocks = None
+    cache_path = None
+    last_edited = None
+
+    if cache_dir:
+        page = get_page(notion, pid)
+        if page is None:
+            return None
+        last_edited = page.get("last_edited_time")
+        if title is None:
+            title = _title_from_properties(page.get("properties", {})) or "Untitled"
+        cache_path = os.path.join(cache_dir, f"{pid}.json")
+        blocks = _load_cached_blocks(cache_path, last_edited)
+
+    if title is None:
+        title = get_page_title(notion, pid)
+        if title is None:
+            return None
+
+    print(f"  Exporting: {title}")
+
+    if blocks is None:
+        try:
+            # Fetch page blocks (page content is stored as block children)
+            blocks = fetch_all_block_children(notion, pid)
+            hydrate_children(notion, blocks, block_pool)
+        except APIResponseError as e:
+            # Without the up-front retrieve, inaccessibility surfaces here.
+            if getattr(e, "status", None) in (403, 404):
+                print(f"  [SKIP] Cannot access page {pid}: {e}")
+                return None
+            raise
+        if cache_path:
+            _store_cached_blocks(cache_path, last_edited, blocks)
+
+    discovered: Dict[str, str] = {}
+    _collect_child_page_titles(blocks, discovered)
+
+    return title, blocks, discovered
+
+
+def _render_page(pid: str, title: str, blocks: List[Dict[str, Any]], out_dir: str) -> PageExport:
+    """
+    Render a fetched page's block tree to a temp markdown file in out_dir.
+    Pure CPU over its arguments (no client, no shared state), so it pickles
+    cleanly and runs in a worker process off the fetcher threads.
+    """
+    # Temporarily empty link map for placeholders; we'll rewrite later.
+    # Stream straight to disk so the page is never held in memory whole.
+    with tempfile.NamedTemporaryFile(
+        "w", dir=out_dir, prefix=".raw-", suffix=".md", delete=False, encoding="utf-8"
+    ) as tmp:
+        render = blocks_to_md(blocks, link_map={}, write=tmp.write)
+    forward = set(x.lower() for x in render.linked_pages if x)
+
+    return PageExport(
+        page_id=pid,
+        title=title,
+        filename=safe_filename(title, pid),
+        raw_path=tmp.name,
+        forward_links=forward,
+    )
+
+
 def export_graph(
     notion: Client,
     root_id: str,
     out_dir: str,
     rewrite_links: bool = True,
+    max_workers: int = 8,
+    cache_dir: Optional[str] = None,
 ) -> Dict[str, PageExport]:
     os.makedirs(out_dir, exist_ok=True)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
 
-    visited: Set[str] = set()
-    skipped: Set[str] = set()
-    queue: List[str] = []
+    # One set for both enqueue-dedup and visited tracking: a page id is added
+    # exactly once, when first submitted, so each enqueue costs one hash probe.
+    seen: Set[str] = set()
+    state_lock = threading.Lock()
 
     exports: Dict[str, PageExport] = {}
 
+    # Flat pid -> filename / pid -> temp-path maps filled during pass 1.
+    # Pass 2 only needs these two; iterating them avoids chasing pointers
+    # through the PageExport dataclasses in the rewrite loop.
+    filenames: Dict[str, str] = {}
+    raw_paths: Dict[str, str] = {}
+
+    # Titles learned before a page is processed (child_page blocks, database
+    # query properties); lets _process_page skip its pages.retrieve call.
+    # Only ever updated from the main thread, workers just read it.
+    titles: Dict[str, str] = {}
+
     # Detect if root is a page or database
     id_type = detect_id_type(notion, root_id)
     print(f"Detected root as: {id_type}")
@@ -539,103 +999,164 @@ def export_graph(
         print("Fetching pages from database...")
         db_pages = get_database_pages(notion, root_id)
         print(f"Found {len(db_pages)} pages in database")
-        queue.extend(db_pages)
+        frontier = [pid for pid, _ in db_pages]
+        titles.update({pid.lower(): title for pid, title in db_pages if title})
     else:
-        queue.append(root_id)
-
-    # First pass: crawl pages, collect raw markdown + link graph, pick filenames
-    while queue:
-        pid = queue.pop(0).lower()
-        if pid in visited or pid in skipped:
-            continue
-        visited.add(pid)
-
-        title = get_page_title(notion, pid)
-        if title is None:
-            # Page is inaccessible, skip it
-            skipped.add(pid)
-            visited.discard(pid)  # allow it to be skipped in link rewriting
-            continue
-
-        print(f"  Exporting: {title}")
-
-        # Fetch page blocks (page content is stored as block children)
-        blocks = fetch_all_block_children(notion, pid)
-        hydrate_children(notion, blocks)
-
-        # Temporarily empty link map for placeholders; we'll rewrite later
-        render = blocks_to_md(blocks, link_map={})
-        md_raw = render.md
-        forward = set(x.lower() for x in render.linked_pages if x)
-
-        filename = safe_filename(title, pid)
-
-        exports[pid] = PageExport(
-            page_id=pid,
-            title=title,
-            filename=filename,
-            md_raw=md_raw,
-            forward_links=forward,
-        )
-
-        # Enqueue newly discovered pages
-        for fpid in forward:
-            if fpid not in visited and fpid not in skipped:
-                queue.append(fpid)
-
-    # Build link map page_id -> filename
-    link_map = {pid: exp.filename for pid, exp in exports.items()}
-
-    # Second pass: write files, rewriting placeholders
-    for pid, exp in exports.items():
-        md = exp.md_raw
-
-        if rewrite_links:
-            # Replace {PAGE:<pid>} placeholders with relative links or notion URLs fallback
-            md = replace_page_placeholders(md, link_map)
+        frontier = [root_id]
+
+    # First pass, as a producer/consumer pipeline: fetcher threads pull
+    # pages and blocks off the network while a small process pool renders
+    # completed block trees to markdown, so render CPU hides behind fetch
+    # latency instead of stalling the crawl. Two thread pools because page
+    # workers block while hydrating children — child fetches need their own
+    # pool to avoid deadlocking when every page worker is waiting on them.
+    # Worker processes are spawned (not forked) since fetcher threads are
+    # already running when the first render is submitted.
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+    ) as render_pool, ThreadPoolExecutor(max_workers=max_workers) as page_pool, ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as block_pool:
+        fetching: Dict[concurrent.futures.Future, str] = {}
+        rendering: Dict[concurrent.futures.Future, str] = {}
+
+        def submit_all(pids) -> None:
+            # Dedup the whole batch under a single lock acquisition; only ids
+            # never seen before get a future, so the pipeline stays bounded
+            # by the true page count no matter how densely pages cross-link.
+            new_pids: List[str] = []
+            with state_lock:
+                for pid in pids:
+                    pid = pid.lower()
+                    if pid not in seen:
+                        seen.add(pid)
+                        new_pids.append(pid)
+            for pid in new_pids:
+                fetching[page_pool.submit(_fetch_page, notion, pid, block_pool, titles, cache_dir)] = pid
+
+        submit_all(frontier)
+
+        while fetching or rendering:
+            done, _ = concurrent.futures.wait(
+                set(fetching) | set(rendering), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for fut in done:
+                if fut in fetching:
+                    pid = fetching.pop(fut)
+                    result = fut.result()
+                    if result is None:
+                        # Page is inaccessible; it stays in `seen` so forward
+                        # links to it are never re-enqueued, and it never
+                        # enters exports, so link rewriting falls back to the
+                        # notion.so URL.
+                        continue
+                    title, blocks, discovered_titles = result
+                    titles.update(discovered_titles)
+                    rendering[render_pool.submit(_render_page, pid, title, blocks, out_dir)] = pid
+                else:
+                    pid = rendering.pop(fut)
+                    exp = fut.result()
+                    exports[pid] = exp
+                    filenames[pid] = exp.filename
+                    raw_paths[pid] = exp.raw_path
+
+                    # Enqueue pages discovered during rendering
+                    submit_all(exp.forward_links)
+
+    # The filenames map doubles as the link map (page_id -> filename).
+    rewrite = make_placeholder_rewriter(filenames)
+
+    # Second pass: stream each page's temp file into its final file,
+    # rewriting placeholders line by line (placeholders never span lines).
+    # Index entries are collected as pages are flushed, sorted once at the
+    # end, and written with a single buffered writelines.
+    index_entries: List[Tuple[str, str]] = []
+    for pid, raw_path in raw_paths.items():
+        path = os.path.join(out_dir, filenames[pid])
+        with open(raw_path, "r", encoding="utf-8") as src, open(path, "w", encoding="utf-8") as dst:
+            # Prepend a small front-matter-ish header (optional; comment out if you don’t want it)
+            dst.write(f"<!-- Exported from Notion page: {pid} -->\n")
+            if rewrite_links:
+                # Replace {PAGE:<pid>} placeholders with relative links or notion URLs fallback
+                for line in src:
+                    dst.write(rewrite(line))
+            else:
+                shutil.copyfileobj(src, dst)
+        os.remove(raw_path)
 
-        # Prepend a small front-matter-ish header (optional; comment out if you don’t want it)
-        header = f"<!-- Exported from Notion page: {pid} -->\n"
-        content = header + md
+        title = exports[pid].title
+        index_entries.append((title.lower(), f"- [{title}](./{filenames[pid]})\n"))
 
-        path = os.path.join(out_dir, exp.filename)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+    index_entries.sort(key=lambda entry: entry[0])
+    index_path = os.path.join(out_dir, "_INDEX.md")
+    with open(index_path, "w", encoding="utf-8", buffering=64 * 1024) as f:
+        f.write("# Notion Export Index\n\n")
+        f.writelines(line for _, line in index_entries)
+    print(f"Wrote index: {index_path}")
 
     return exports
 
 
 def main():
+    global RATE_LIMITER, RETRY_MAX_TRIES, RETRY_BASE_SLEEP
+
     ap = argparse.ArgumentParser()
     ap.add_argument("--root-url", required=True, help="Root Notion page URL or page id")
     ap.add_argument("--out", default="./notion_export", help="Output folder")
     ap.add_argument("--token", default=os.getenv("NOTION_TOKEN"), help="Notion integration token (or env NOTION_TOKEN)")
     ap.add_argument("--notion-version", default=os.getenv("NOTION_VERSION", NOTION_VERSION_DEFAULT))
     ap.add_argument("--no-rewrite-links", action="store_true", help="Do not rewrite page links to relative paths")
+    ap.add_argument("--max-tries", type=int, default=RETRY_MAX_TRIES, help="Max attempts per Notion API call")
+    ap.add_argument("--base-sleep", type=float, default=RETRY_BASE_SLEEP, help="Base backoff sleep in seconds")
+    ap.add_argument("--rps", type=float, default=3.0, help="Max Notion API requests per second")
+    ap.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Cache fetched blocks here, keyed by last_edited_time, for fast incremental re-exports",
+    )
     args = ap.parse_args()
 
+    RATE_LIMITER = TokenBucket(rate=args.rps, capacity=max(args.rps, 1.0))
+    RETRY_MAX_TRIES = args.max_tries
+    RETRY_BASE_SLEEP = args.base_sleep
+
     if not args.token:
         raise SystemExit("Missing Notion token. Provide --token or set NOTION_TOKEN env var.")
 
     root_page_id = normalize_page_id(args.root_url)
 
-    notion = Client(auth=args.token, notion_version=args.notion_version)
-
-    exports = export_graph(
-        notion=notion,
-        root_id=root_page_id,
-        out_dir=args.out,
-        rewrite_links=not args.no_rewrite_links,
+    cache_dir = None
+    if args.cache_dir:
+        # Scope the cache to the integration so a token change invalidates it.
+        token_scope = hashlib.sha256(args.token.encode("utf-8")).hexdigest()[:12]
+        cache_dir = os.path.join(args.cache_dir, token_scope)
+
+    # One pooled HTTP client for the whole export: every Notion call reuses
+    # a kept-alive TLS connection instead of paying a fresh handshake.
+    http_client = httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        timeout=httpx.Timeout(60.0),
     )
+    if orjson is not None:
+        # notion_client reads every response through httpx.Response.json();
+        # route that through orjson, which parses big block payloads several
+        # times faster than stdlib json.
+        httpx.Response.json = lambda self, **kwargs: orjson.loads(self.content)
+
+    notion = Client(auth=args.token, notion_version=args.notion_version, client=http_client)
+
+    try:
+        exports = export_graph(
+            notion=notion,
+            root_id=root_page_id,
+            out_dir=args.out,
+            rewrite_links=not args.no_rewrite_links,
+            cache_dir=cache_dir,
+        )
+    finally:
+        http_client.close()
 
     print(f"Exported {len(exports)} pages to: {os.path.abspath(args.out)}")
-    # Print an index file for convenience
-    index_path = os.path.join(args.out, "_INDEX.md")
-    with open(index_path, "w", encoding="utf-8") as f:
-        f.write("# Notion Export Index\n\n")
-        for pid, exp in sorted(exports.items(), key=lambda kv: kv[1].title.lower()):
-            f.write(f"- [{exp.title}](./{exp.filename})\n")
-    print(f"Wrote index: {index_path}")
 
 
 if __name__ == "__main__":